@@ -30,8 +30,8 @@ def ruff(c: Context, no_fix=False, unsafe_fixes=False):
     """Run ruff checks and formatting. Use --unsafe-fixes to apply unsafe fixes."""
     fix_flag = "" if no_fix else "--fix"
     unsafe_fixes_flag = "--unsafe-fixes" if unsafe_fixes else ""
-    c.run(f"ruff check {fix_flag} {unsafe_fixes_flag}", echo=True, pty=True)
-    c.run("ruff format", echo=True, pty=True)
+    c.run(f"ruff check {fix_flag} {unsafe_fixes_flag}", echo=True)
+    c.run("ruff format", echo=True)
 
 
 aws_collection = Collection.from_module(tasks_aws, name="aws")
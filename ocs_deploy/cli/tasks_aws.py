@@ -1,4 +1,6 @@
-from invoke import Context, task
+import sys
+
+from invoke import Context, Exit, task
 
 from ocs_deploy.config import OCSConfig
 from ocs_deploy.cli.tasks_aws_utils import (
@@ -43,6 +45,9 @@ def connect(c: Context, command="bash -l", service="django", profile=DEFAULT_PRO
         "stacks": STACKS_HELP,
         "verbose": "Enable verbose output",
         "skip_approval": "Do not prompt for approval before deploying",
+        "image_tag": "Docker image tag to use for the Django services. Defaults to 'latest'",
+        "concurrency": "Maximum number of independent stacks to deploy in parallel. "
+        "Values above 1 require --skip-approval",
     }
     | PROFILE_HELP,
     auto_shortflags=False,
@@ -53,25 +58,36 @@ def deploy(
     verbose=False,
     profile=DEFAULT_PROFILE,
     skip_approval=False,
+    image_tag=None,
+    concurrency=None,
 ):
     """Deploy the specified stacks. If no stacks are specified, all stacks will be deployed."""
+    if concurrency and int(concurrency) > 1 and not skip_approval:
+        # cdk can't prompt for approval when deploying stacks in parallel
+        raise Exit("--concurrency greater than 1 requires --skip-approval", -1)
+
     profile = get_profile_and_auth(c, profile)
 
     config = _get_config(c)
     cmd = "cdk deploy"
     if stacks:
         stacks = " ".join([config.stack_name(stack) for stack in stacks.split(",")])
-        cmd += f" {stacks} --exclusive"
+        cmd += f" {stacks} --exclusively"
     else:
         confirm("Deploy all stacks ?", _exit=True, exit_message="Aborted")
         cmd += " --all"
     if verbose:
         cmd += " --verbose"
+    if concurrency:
+        cmd += f" --concurrency {concurrency}"
 
     cmd += f" --profile {profile} --context ocs_env={config.environment}"
+    if image_tag:
+        cmd += f" --context image_tag={image_tag}"
     cmd += " --require-approval " + ("never" if skip_approval else "any-change")
     cmd += " --progress events"
-    c.run(cmd, echo=True, pty=True)
+    # a TTY is only needed to answer cdk's approval prompt interactively
+    c.run(cmd, echo=True, pty=sys.stdin.isatty())
 
 
 @task(
@@ -153,7 +169,7 @@ def _update_services(
         exit_message="Aborted",
     )
 
-    cluster = config.make_name("Cluster")
+    cluster = config.ecs_cluster_name
     service_names = []
     for service in services:
         service_name, _ = _get_service_and_container(config, service)
@@ -1,6 +1,11 @@
+import configparser
+import functools
 import json
 import os
 import shlex
+import time
+from datetime import UTC, datetime
+from pathlib import Path
 
 from invoke import Context, Exit, task
 from termcolor import cprint
@@ -13,6 +18,12 @@ PROFILE_HELP = {
     "profile": "AWS profile to use for deployment. Will read from AWS_PROFILE env var if not set."
 }
 
+# profiles whose credentials have already been verified in this process
+_VALID_PROFILES = set()
+
+CREDENTIALS_CACHE_DIR = Path.home() / ".cache" / "ocs-deploy"
+CREDENTIALS_CACHE_TTL = 300  # seconds
+
 
 @task(name="login", help=PROFILE_HELP)
 def aws_login(c: Context, profile=DEFAULT_PROFILE):
@@ -39,10 +50,82 @@ def _shell(c: Context, profile=DEFAULT_PROFILE, mgmt_command="shell"):
 
 
 def _check_credentials(c: Context, profile: str):
+    if profile in _VALID_PROFILES:
+        return True
+    # SSO profiles are checked against the token itself since the session can expire
+    # or be logged out at any time
+    sso_start_url = _sso_start_url(profile)
+    if sso_start_url:
+        if _sso_token_valid(sso_start_url):
+            return True
+    elif _credentials_cached(profile):
+        return True
     result = c.run(aws_cli("sts get-caller-identity", profile), warn=True, hide=True)
+    if result.ok:
+        _VALID_PROFILES.add(profile)
+        if not sso_start_url:
+            _cache_credentials(profile)
     return result.ok
 
 
+def _credentials_cached(profile: str):
+    """Check if the credentials for this profile were verified recently."""
+    try:
+        data = json.loads(_credentials_cache_path(profile).read_text())
+        return data["expires"] > time.time()
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
+
+def _cache_credentials(profile: str):
+    path = _credentials_cache_path(profile)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"expires": time.time() + CREDENTIALS_CACHE_TTL}))
+    except OSError:
+        pass
+
+
+def _credentials_cache_path(profile: str):
+    return CREDENTIALS_CACHE_DIR / f"creds-{profile}.json"
+
+
+def _sso_start_url(profile: str):
+    """Get the SSO start URL for the profile from the AWS CLI config, if it uses SSO."""
+    config_path = os.path.expanduser(os.getenv("AWS_CONFIG_FILE", "~/.aws/config"))
+    aws_config = configparser.RawConfigParser()
+    try:
+        aws_config.read(config_path)
+    except configparser.Error:
+        return None
+    section = "default" if profile == "default" else f"profile {profile}"
+    start_url = aws_config.get(section, "sso_start_url", fallback=None)
+    if session := aws_config.get(section, "sso_session", fallback=None):
+        start_url = aws_config.get(
+            f"sso-session {session}", "sso_start_url", fallback=start_url
+        )
+    return start_url
+
+
+def _sso_token_valid(start_url: str):
+    """Check the AWS CLI SSO cache for an unexpired token for this start URL.
+
+    With a valid SSO token the AWS CLI can fetch role credentials itself so there is
+    no need to call STS to check that we are logged in."""
+    now = datetime.now(UTC)
+    for path in (Path.home() / ".aws" / "sso" / "cache").glob("*.json"):
+        try:
+            token = json.loads(path.read_text())
+            if token.get("startUrl") != start_url or "accessToken" not in token:
+                continue
+            expires = datetime.fromisoformat(token["expiresAt"])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            continue
+        if expires.tzinfo and expires > now:
+            return True
+    return False
+
+
 def get_profile_and_auth(c: Context, profile):
     if not profile:
         env = c.config.environment
@@ -69,6 +152,11 @@ def _get_config(c: Context):
             -1,
         )
     cprint(f"Using environment: {env}", color="blue")
+    return _load_config(env)
+
+
+@functools.cache
+def _load_config(env):
     return OCSConfig(env)
 
 
@@ -131,11 +219,18 @@ def _ssm_connect(c, config, command, service, profile):
 
 
 def _fargate_connect(c: Context, config, command, service, profile):
-    cluster = config.make_name("Cluster")
+    cluster = config.ecs_cluster_name
     service, container = _get_service_and_container(config, service)
 
     result = c.run(
-        aws_cli("ecs list-tasks", profile, service=service, cluster=cluster),
+        aws_cli(
+            "ecs list-tasks",
+            profile,
+            service=service,
+            cluster=cluster,
+            max_items="1",
+            page_size="1",
+        ),
         hide=True,
     )
     response = json.loads(result.stdout)
@@ -165,13 +260,13 @@ def _fargate_connect(c: Context, config, command, service, profile):
 def _get_service_and_container(config, service):
     match service:
         case "django":
-            service = config.make_name("Django")
+            service = config.ecs_django_service_name
             container = "web"
         case "celery":
-            service = config.make_name("Celery")
+            service = config.ecs_celery_service_name
             container = "celery-worker"
         case "beat":
-            service = config.make_name("CeleryBeat")
+            service = config.ecs_celery_beat_service_name
             container = "celery-beat"
         case _:
             raise Exit(f"Unknown service '{service}'", -1)
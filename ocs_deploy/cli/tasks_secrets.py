@@ -1,4 +1,5 @@
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from invoke import Context, Exit, task
 from termcolor import cprint
@@ -25,15 +26,20 @@ def list_secrets(c: Context, profile=DEFAULT_PROFILE):
     writer.write_table()
 
 
-def _get_secrets(c, config, profile, name="", include_missing=True):
-    filter_expr = f'Key="name",Values="{config.make_secret_name(name)}"'
+def _list_secrets(c, config, profile):
+    """List all the secrets for the environment."""
+    filter_expr = f'Key="name",Values="{config.make_secret_name("")}"'
     results = c.run(
         aws_cli("secretsmanager list-secrets", profile, filter=filter_expr),
         hide=True,
         echo=True,
     )
     response = json.loads(results.stdout)
-    secrets = [Secret.from_dict(raw) for raw in response.get("SecretList", [])]
+    return [Secret.from_dict(raw) for raw in response.get("SecretList", [])]
+
+
+def _get_secrets(c, config, profile, include_missing=True):
+    secrets = _list_secrets(c, config, profile)
 
     if include_missing:
         present = {secret.name for secret in secrets}
@@ -53,9 +59,7 @@ def get_secret_value(c: Context, name, profile=DEFAULT_PROFILE):
     """Get a secret value by name."""
     config = _get_config(c)
     profile = get_profile_and_auth(c, profile)
-    prefix = config.make_secret_name("")
-    if not name.startswith(prefix):
-        name = config.make_secret_name(name)
+    name = config.normalize_secret_name(name)
     results = c.run(
         aws_cli("secretsmanager get-secret-value", profile, secret_id=name),
         hide=True,
@@ -83,11 +87,12 @@ def set_secret_value(c: Context, name, profile=DEFAULT_PROFILE):
     except ValueError:
         raise Exit("Unknown secret", -1)
 
-    existing = _get_secrets(c, config, profile, name)
-
-    prefix = config.make_secret_name("")
-    if not name.startswith(prefix):
-        name = config.make_secret_name(name)
+    name = config.normalize_secret_name(name)
+    existing = [
+        other
+        for other in _get_secrets(c, config, profile, include_missing=False)
+        if other.name == name
+    ]
 
     if secret.managed:
         confirm(
@@ -151,6 +156,7 @@ def create_missing_secrets(c: Context, profile=DEFAULT_PROFILE):
     config = _get_config(c)
     profile = get_profile_and_auth(c, profile)
     secrets = _get_secrets(c, config, profile, include_missing=True)
+    values = {}
     for secret in secrets:
         if secret.created:
             continue
@@ -163,28 +169,56 @@ def create_missing_secrets(c: Context, profile=DEFAULT_PROFILE):
         if not value:
             print("Skipping...")
             continue
+        values[secret.name] = value
 
-        c.run(
-            aws_cli(
-                "secretsmanager create-secret",
-                profile,
-                name=secret.name,
-                secret_string=value,
-            ),
-            echo=True,
-        )
+    if not values:
+        return
+
+    # The secrets are independent so create them concurrently
+    failed = []
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            executor.submit(
+                c.run,
+                aws_cli(
+                    "secretsmanager create-secret",
+                    profile,
+                    name=name,
+                    secret_string=value,
+                ),
+                hide=True,
+                warn=True,
+                # don't mirror stdin from multiple threads
+                in_stream=False,
+            ): name
+            for name, value in values.items()
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            result = future.result()
+            if result.ok:
+                cprint(f"Created secret: {name}", "green")
+            else:
+                failed.append(name)
+                cprint(
+                    f"Failed to create secret {name}: {result.stderr.strip()}", "red"
+                )
+
+    if failed:
+        raise Exit(f"Failed to create secrets: {', '.join(sorted(failed))}", -1)
 
 
 class TableWriter:
     def __init__(self, headers, rows):
         self.headers = headers
-        self.col_widths = [
-            max(len(str(cell)) for cell in column) for column in zip(headers, *rows)
-        ]
+        self.rows = [[str(cell) for cell in row] for row in rows]
+        self.col_widths = [len(header) for header in headers]
+        for row in self.rows:
+            for i, cell in enumerate(row):
+                self.col_widths[i] = max(self.col_widths[i], len(cell))
         self.template = " | ".join(
             ["{{:<{}}}".format(width) for width in self.col_widths]
         )
-        self.rows = rows
 
     def write_table(self):
         self.write_headers()
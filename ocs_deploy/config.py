@@ -1,9 +1,9 @@
 import dataclasses
+import functools
 import re
 from datetime import datetime
 from pathlib import Path
 
-import yaml
 from dotenv import dotenv_values
 
 
@@ -73,10 +73,8 @@ class OCSConfig:
         return cdk.Environment(account=self.account, region=self.region)
 
     def make_name(self, name: str = "", include_region=False):
-        name = f"-{name}" if name else ""
-        if include_region:
-            return f"{self.app_name}-{self.environment}-{self.region}{name}"
-        return f"{self.app_name}-{self.environment}{name}"
+        region = self.region if include_region else ""
+        return _make_name(self.app_name, self.environment, region, name)
 
     def make_secret_name(self, name: str):
         if re.match(r"-[a-zA-Z]{6}$", name):
@@ -159,18 +157,33 @@ class OCSConfig:
         return found[0]
 
     def get_secrets_list(self):
-        path = Path(__file__).parent / "secrets.yml"
-        with path.open() as f:
-            data = yaml.safe_load(f)
         return [
             Secret(
                 name=self.make_secret_name(raw["name"]),
                 managed=raw.get("managed", False),
             )
-            for raw in data["secrets"]
+            for raw in _load_secrets_file()
         ]
 
 
+@functools.lru_cache(maxsize=1024)
+def _make_name(app_name: str, environment: str, region: str, name: str):
+    name = f"-{name}" if name else ""
+    if region:
+        return f"{app_name}-{environment}-{region}{name}"
+    return f"{app_name}-{environment}{name}"
+
+
+@functools.cache
+def _load_secrets_file():
+    import yaml
+
+    path = Path(__file__).parent / "secrets.yml"
+    with path.open() as f:
+        data = yaml.safe_load(f)
+    return tuple(data["secrets"])
+
+
 @dataclasses.dataclass
 class Secret:
     name: str
@@ -1,3 +1,4 @@
+import os
 from functools import cached_property
 
 import aws_cdk as cdk
@@ -45,19 +46,16 @@ class FargateStack(cdk.Stack):
         self.rds_stack = rds_stack
         self.redis_stack = redis_stack
         self.domain_stack = domain_stack
+        self.ecr_repo = ecr_repo
 
         self.fargate_service = self.setup_fargate_service(vpc, ecr_repo, config)
 
     def setup_fargate_service(self, vpc, ecr_repo, config: OCSConfig):
-        http_sg = ec2.SecurityGroup(
-            self, config.make_name("HttpSG"), vpc=vpc, allow_all_outbound=True
+        web_sg = ec2.SecurityGroup(
+            self, config.make_name("WebSG"), vpc=vpc, allow_all_outbound=True
         )
-        http_sg.add_ingress_rule(ec2.Peer.any_ipv4(), ec2.Port.tcp(80))
-
-        https_sg = ec2.SecurityGroup(
-            self, config.make_name("HttpsSG"), vpc=vpc, allow_all_outbound=True
-        )
-        https_sg.add_ingress_rule(ec2.Peer.any_ipv4(), ec2.Port.tcp(443))
+        web_sg.add_ingress_rule(ec2.Peer.any_ipv4(), ec2.Port.tcp(80))
+        web_sg.add_ingress_rule(ec2.Peer.any_ipv4(), ec2.Port.tcp(443))
 
         # define a cluster with spot instances, linux type
         cluster = ecs.Cluster(
@@ -72,7 +70,7 @@ class FargateStack(cdk.Stack):
             self,
             config.make_name("DjangoWebService"),
             cluster=cluster,
-            security_groups=[http_sg, https_sg],
+            security_groups=[web_sg],
             desired_count=1,
             public_load_balancer=True,
             load_balancer_name=config.make_name("LoadBalancer"),
@@ -136,20 +134,17 @@ class FargateStack(cdk.Stack):
         return django_web_service
 
     def _get_web_task_definition(self, ecr_repo, config: OCSConfig):
-        log_group = self._get_log_group(config.make_name("DjangoLogs"))
-        log_driver = ecs.AwsLogDriver(
-            stream_prefix=config.make_name(), log_group=log_group
-        )
-
-        image = ecs.ContainerImage.from_ecr_repository(ecr_repo, tag="latest")
+        log_driver = self._get_log_driver(config, "DjangoLogs")
+        image = self._get_image(ecr_repo)
+        task_name = config.make_name("Django")
         django_task = ecs.FargateTaskDefinition(
             self,
-            id=config.make_name("Django"),
+            id=task_name,
             cpu=512,
             memory_limit_mib=1024,
             execution_role=self.execution_role,
             task_role=self.task_role,
-            family=config.make_name("Django"),
+            family=task_name,
         )
         migration_container = django_task.add_container(
             id="django_container",
@@ -192,6 +187,14 @@ class FargateStack(cdk.Stack):
 
         return django_task
 
+    def _get_image(self, ecr_repo):
+        tag = self.node.try_get_context("image_tag") or os.getenv("IMAGE_TAG", "latest")
+        return ecs.ContainerImage.from_ecr_repository(ecr_repo, tag=tag)
+
+    def _get_log_driver(self, config: OCSConfig, log_group_name):
+        log_group = self._get_log_group(config.make_name(log_group_name))
+        return ecs.AwsLogDriver(stream_prefix=config.make_name(), log_group=log_group)
+
     def _get_log_group(self, name):
         return logs.LogGroup(
             self,
@@ -241,21 +244,18 @@ class FargateStack(cdk.Stack):
             #     retries=4,
             # )
 
-        log_group = self._get_log_group(config.make_name(log_group_name))
-        log_driver = ecs.AwsLogDriver(
-            stream_prefix=config.make_name(), log_group=log_group
-        )
-
-        image = ecs.ContainerImage.from_ecr_repository(ecr_repo, tag="latest")
+        log_driver = self._get_log_driver(config, log_group_name)
+        image = self._get_image(ecr_repo)
 
+        task_name = config.make_name(name)
         celery_task = ecs.FargateTaskDefinition(
             self,
-            id=config.make_name(name),
+            id=task_name,
             cpu=cpu,
             memory_limit_mib=memory,
             execution_role=self.execution_role,
             task_role=self.task_role,
-            family=config.make_name(name),
+            family=task_name,
         )
 
         celery_task.add_container(
@@ -316,6 +316,9 @@ class FargateStack(cdk.Stack):
             "AWS_PRIVATE_STORAGE_BUCKET_NAME": self.config.s3_private_bucket_name,
             "AWS_PUBLIC_STORAGE_BUCKET_NAME": self.config.s3_public_bucket_name,
             "AWS_S3_REGION": self.config.region,
+            # keep idle pooled connections alive; standard retry mode for throttling
+            "AWS_RETRY_MODE": "standard",
+            "BOTOCORE_TCP_KEEPALIVE": "true",
             "DJANGO_DATABASE_NAME": self.config.rds_db_name,
             "DJANGO_DATABASE_HOST": self.rds_stack.db_instance.instance_endpoint.hostname,
             "DJANGO_DATABASE_PORT": self.rds_stack.db_instance.db_instance_endpoint_port,
@@ -343,25 +346,38 @@ class FargateStack(cdk.Stack):
             assumed_by=iam.ServicePrincipal("ecs-tasks.amazonaws.com"),
             role_name=self.config.ecs_task_execution_role,
         )
-        # Add permissions to the Task Role
-        execution_role.add_managed_policy(
-            iam.ManagedPolicy.from_aws_managed_policy_name(
-                "service-role/AmazonECSTaskExecutionRolePolicy"
-            )
-        )
+        # These statements replace the AmazonECSTaskExecutionRolePolicy managed policy
+        # which grants the same actions on all resources.
         # Add permissions to the Task Role to allow it to pull images from ECR
         execution_role.add_to_policy(
             iam.PolicyStatement(
                 effect=iam.Effect.ALLOW,
                 actions=[
-                    "ecr:GetAuthorizationToken",
                     "ecr:BatchCheckLayerAvailability",
                     "ecr:GetDownloadUrlForLayer",
                     "ecr:BatchGetImage",
+                ],
+                resources=[self.ecr_repo.repository_arn],
+            )
+        )
+        # GetAuthorizationToken does not support resource level permissions
+        execution_role.add_to_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["ecr:GetAuthorizationToken"],
+                resources=["*"],
+            )
+        )
+        execution_role.add_to_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=[
                     "logs:CreateLogStream",
                     "logs:PutLogEvents",
                 ],
-                resources=["*"],
+                resources=[
+                    f"arn:aws:logs:{self.config.region}:{self.config.account}:log-group:{self.config.make_name()}-*"
+                ],
             )
         )
         return execution_role
@@ -375,26 +391,32 @@ class FargateStack(cdk.Stack):
             assumed_by=iam.ServicePrincipal("ecs-tasks.amazonaws.com"),
             role_name=self.config.ecs_task_role_name,
         )
+        bucket_arns = [
+            f"arn:aws:s3:::{self.config.s3_private_bucket_name}",
+            f"arn:aws:s3:::{self.config.s3_public_bucket_name}",
+            f"arn:aws:s3:::{self.config.s3_whatsapp_audio_bucket}",
+        ]
+        task_role.add_to_policy(
+            iam.PolicyStatement(
+                actions=[
+                    "s3:ListBucket",
+                    "s3:GetBucketAcl",
+                ],
+                effect=iam.Effect.ALLOW,
+                resources=bucket_arns,
+            )
+        )
         task_role.add_to_policy(
             iam.PolicyStatement(
                 actions=[
                     "s3:PutObject",
                     "s3:GetObjectAcl",
                     "s3:GetObject",
-                    "s3:ListBucket",
                     "s3:DeleteObject",
                     "s3:PutObjectAcl",
-                    "s3:GetBucketAcl",
                 ],
                 effect=iam.Effect.ALLOW,
-                resources=[
-                    f"arn:aws:s3:::{self.config.s3_private_bucket_name}",
-                    f"arn:aws:s3:::{self.config.s3_private_bucket_name}/*",
-                    f"arn:aws:s3:::{self.config.s3_public_bucket_name}",
-                    f"arn:aws:s3:::{self.config.s3_public_bucket_name}/*",
-                    f"arn:aws:s3:::{self.config.s3_whatsapp_audio_bucket}",
-                    f"arn:aws:s3:::{self.config.s3_whatsapp_audio_bucket}/*",
-                ],
+                resources=[f"{arn}/*" for arn in bucket_arns],
             )
         )
         task_role.add_to_policy(
@@ -16,7 +16,8 @@ class GithubOidcStack(cdk.Stack):
         self.setup_github_actions_role(config)
 
     def setup_github_actions_role(self, config: OCSConfig):
-        arn = f"arn:aws:iam::{config.account}:oidc-provider/token.actions.githubusercontent.com"
+        iam_prefix = f"arn:aws:iam::{config.account}"
+        arn = f"{iam_prefix}:oidc-provider/token.actions.githubusercontent.com"
 
         # Create provider, so github can connect to AWS
         iam.OpenIdConnectProvider(
@@ -47,7 +48,8 @@ class GithubOidcStack(cdk.Stack):
             role_name="github_deploy",
         )
 
-        role.add_to_policy(
+        service_prefix = f"arn:aws:ecs:{config.region}:{config.account}:service/{config.ecs_cluster_name}"
+        statements = [
             iam.PolicyStatement(
                 sid="PushToECR",
                 actions=[
@@ -63,44 +65,28 @@ class GithubOidcStack(cdk.Stack):
                 resources=[
                     f"arn:aws:ecr:{config.region}:{config.account}:repository/{config.ecr_repo_name}"
                 ],
-            )
-        )
-        role.add_to_policy(
+            ),
+            # These actions do not support resource level permissions.
+            # See https://github.com/aws-actions/amazon-ecs-deploy-task-definition?tab=readme-ov-file#permissions
             iam.PolicyStatement(
-                sid="GetECRToken",
+                sid="GetECRTokenAndRegisterTaskDefinition",
                 actions=[
                     "ecr:GetAuthorizationToken",
-                ],
-                effect=iam.Effect.ALLOW,
-                resources=["*"],
-            )
-        )
-
-        # See https://github.com/aws-actions/amazon-ecs-deploy-task-definition?tab=readme-ov-file#permissions
-        role.add_to_policy(
-            iam.PolicyStatement(
-                sid="RegisterTaskDefinition",
-                actions=[
                     "ecs:RegisterTaskDefinition",
                     "ecs:DescribeTaskDefinition",
                 ],
                 effect=iam.Effect.ALLOW,
                 resources=["*"],
-            )
-        )
-        role.add_to_policy(
+            ),
             iam.PolicyStatement(
                 sid="PassRolesInTaskDefinition",
                 actions=["iam:PassRole"],
                 resources=[
-                    f"arn:aws:iam::{config.account}:role/{config.ecs_task_role_name}",
-                    f"arn:aws:iam::{config.account}:role/{config.ecs_task_execution_role}",
+                    f"{iam_prefix}:role/{config.ecs_task_role_name}",
+                    f"{iam_prefix}:role/{config.ecs_task_execution_role}",
                 ],
                 effect=iam.Effect.ALLOW,
-            )
-        )
-        service_prefix = f"arn:aws:ecs:{config.region}:{config.account}:service/{config.ecs_cluster_name}"
-        role.add_to_policy(
+            ),
             iam.PolicyStatement(
                 sid="DeployService",
                 actions=[
@@ -113,5 +99,11 @@ class GithubOidcStack(cdk.Stack):
                     f"{service_prefix}/{config.ecs_celery_beat_service_name}",
                 ],
                 effect=iam.Effect.ALLOW,
-            )
+            ),
+        ]
+        iam.Policy(
+            self,
+            config.make_name("GithubActionsPolicy"),
+            roles=[role],
+            statements=statements,
         )
@@ -19,10 +19,11 @@ class RdsStack(cdk.Stack):
         self.db_instance = self.setup_rds_database(vpc, config)
 
     def setup_rds_database(self, vpc, config: OCSConfig):
+        rds_sg_name = config.make_name("RdsSG")
         db_server_sg = ec2.SecurityGroup(
             self,
-            config.make_name("RdsSG"),
-            security_group_name=config.make_name("RdsSG"),
+            rds_sg_name,
+            security_group_name=rds_sg_name,
             vpc=vpc,
             allow_all_outbound=True,
         )
@@ -31,11 +32,12 @@ class RdsStack(cdk.Stack):
         )
 
         # Create a new IAM role that can be assumed by the RDS service
+        rds_role_name = config.make_name("RDSRole")
         rds_role = iam.Role(
             self,
-            config.make_name("RDSRole"),
+            rds_role_name,
             assumed_by=iam.ServicePrincipal("rds.amazonaws.com"),
-            role_name=config.make_name("RDSRole"),
+            role_name=rds_role_name,
         )
 
         rds_role.add_to_policy(
@@ -19,10 +19,11 @@ class RedisStack(cdk.Stack):
         self.setup_redis_database(vpc, config)
 
     def setup_redis_database(self, vpc, config: OCSConfig):
+        redis_sg_name = config.make_name("RedisSG")
         redis_sec_group = ec2.SecurityGroup(
             self,
-            config.make_name("RedisSG"),
-            security_group_name=config.make_name("RedisSG"),
+            redis_sg_name,
+            security_group_name=redis_sg_name,
             vpc=vpc,
             allow_all_outbound=True,
         )
@@ -34,11 +35,12 @@ class RedisStack(cdk.Stack):
 
         private_subnets_ids = [ps.subnet_id for ps in vpc.private_subnets]
 
+        subnet_group_name = config.make_name("RedisSubnetGroup")
         redis_subnet_group = elasticache.CfnSubnetGroup(
             scope=self,
-            id=config.make_name("RedisSubnetGroup"),
+            id=subnet_group_name,
             subnet_ids=private_subnets_ids,
-            description=config.make_name("RedisSubnetGroup"),
+            description=subnet_group_name,
         )
 
         engine_log_group = self.create_cloudwatch_log_group(
@@ -48,10 +50,11 @@ class RedisStack(cdk.Stack):
             config.make_name("RedisSlowLogs")
         )
 
+        cluster_name = config.make_name("RedisCluster")
         self.redis_cluster = elasticache.CfnCacheCluster(
             scope=self,
-            id=config.make_name("RedisCluster"),
-            cluster_name=config.make_name("RedisCluster"),
+            id=cluster_name,
+            cluster_name=cluster_name,
             engine="redis",
             engine_version="7.1",
             cache_node_type="cache.t3.small",
@@ -5,6 +5,16 @@ from constructs import Construct
 from ocs_deploy.config import OCSConfig
 
 
+INTERFACE_ENDPOINTS = (
+    # Needed for ECS tasks (managed in Fargate) to pull images
+    ("EcsEndpoint", ec2.InterfaceVpcEndpointAwsService.ECS),
+    # Needed for fargate to pull initial image from ECR
+    ("EcrEndpoint", ec2.InterfaceVpcEndpointAwsService.ECR),
+    # TODO: Unclear if we need this
+    ("EcrDockerEndpoint", ec2.InterfaceVpcEndpointAwsService.ECR_DOCKER),
+)
+
+
 class VpcStack(cdk.Stack):
     def __init__(self, scope: Construct, config: OCSConfig) -> None:
         super().__init__(
@@ -42,18 +52,8 @@ class VpcStack(cdk.Stack):
 
         vpc.add_gateway_endpoint("S3", service=ec2.GatewayVpcEndpointAwsService.S3)
 
-        # Needed for ECS tasks (managed in Fargate) to pull images
-        vpc.add_interface_endpoint(
-            "EcsEndpoint", service=ec2.InterfaceVpcEndpointAwsService.ECS
-        )
-        # Needed for fargate to pull initial image from ECR
-        vpc.add_interface_endpoint(
-            "EcrEndpoint", service=ec2.InterfaceVpcEndpointAwsService.ECR
-        )
-        # TODO: Unclear if we need this
-        vpc.add_interface_endpoint(
-            "EcrDockerEndpoint", service=ec2.InterfaceVpcEndpointAwsService.ECR_DOCKER
-        )
+        for endpoint_id, service in INTERFACE_ENDPOINTS:
+            vpc.add_interface_endpoint(endpoint_id, service=service)
 
         self._setup_flow_logs(config, vpc)
 